@@ -9,6 +9,8 @@ from pathlib import Path
 MAX_CONCURRENCY   = 50          # concurrent Wikipedia REST calls
 WIKIDATA_ENDPOINT = "https://query.wikidata.org/sparql"
 MEDIAWIKI_API     = "https://en.wikipedia.org/w/api.php"
+# Minimum spacing (seconds) between the starts of consecutive SPARQL requests
+SPARQL_MIN_INTERVAL = 1.0
 
 # User agent required by Wikipedia API guidelines
 HEADERS = {
@@ -32,3 +34,5 @@ TARGET_GROUPS = [
 # Path configurations for data storage - processed results
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 DATA_PROCESSED = PROJECT_ROOT / "data" / "processed"
+# On-disk cache of raw API responses, reused when a run is resumed
+HTTP_CACHE = PROJECT_ROOT / "data" / "checkpoints" / "http_cache.db"
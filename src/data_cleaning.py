@@ -7,6 +7,19 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Union, Any
 
+# Common Indian languages in films
+LANGUAGES = [
+    'Hindi', 'Tamil', 'Telugu', 'Malayalam', 'Kannada', 
+    'Bengali', 'Marathi', 'Punjabi', 'Gujarati', 'Assamese',
+    'Odia', 'Bhojpuri', 'Urdu'
+]
+
+# Precompiled regex patterns, shared by every call
+_WS_RE = re.compile(r'\s+')
+_IMDB_RE = re.compile(r'^tt\d+$')
+# Matches these languages, e.g. "Tamil-language"
+_LANG_RE = re.compile(r'(?i)(' + '|'.join(LANGUAGES) + r')[\s\-]language')
+
 def clean_dataset(df: pd.DataFrame) -> pd.DataFrame:
     """
     Apply a series of cleaning operations to the film dataset.
@@ -17,7 +30,8 @@ def clean_dataset(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Cleaned DataFrame
     """
-    # Make a copy to avoid modifying the original
+    # Make a single copy to avoid modifying the original; the helpers
+    # below then work on it in place
     cleaned_df = df.copy()
     
     # Apply individual cleaning functions
@@ -27,8 +41,10 @@ def clean_dataset(df: pd.DataFrame) -> pd.DataFrame:
     cleaned_df = clean_summaries(cleaned_df)
     cleaned_df = normalize_people(cleaned_df)
     
-    # Remove duplicate entries
-    cleaned_df = cleaned_df.drop_duplicates(subset=['title'], keep='first')
+    # Remove duplicate entries. Titles come from Q-ID map keys and are
+    # normally unique already, so skip the filtered copy in that case
+    if not cleaned_df['title'].is_unique:
+        cleaned_df = cleaned_df.drop_duplicates(subset=['title'], keep='first')
     
     # Sort by year (descending) and title
     cleaned_df = cleaned_df.sort_values(by=['year', 'title'], ascending=[False, True], na_position='last')
@@ -36,139 +52,79 @@ def clean_dataset(df: pd.DataFrame) -> pd.DataFrame:
     return cleaned_df
 
 def clean_titles(df: pd.DataFrame) -> pd.DataFrame:
-    """Clean and standardize film titles."""
-    # Make a copy to avoid modifying the original
-    df = df.copy()
-    
-    # Fix common patterns in titles
-    def clean_title(title):
-        if pd.isna(title):
-            return title
-            
-        # Remove trailing spaces
-        title = title.strip()
-        
-        # Fix common patterns
-        if " (film)" in title or " (movie)" in title:
-            # Keep the part in parentheses to avoid ambiguity
-            pass
-        
-        # Fix quotation marks
-        title = title.replace('"', '"').replace('"', '"')
-        
-        return title
-    
-    df['title'] = df['title'].apply(clean_title)
+    """Clean and standardize film titles (in place)."""
+    # Remove leading/trailing spaces; parenthesised qualifiers like " (film)"
+    # are kept to avoid ambiguity
+    # Cast to object first: an all-empty column read from CSV is float64
+    df['title'] = df['title'].astype(object).str.strip()
     
     return df
 
 def standardize_imdb_ids(df: pd.DataFrame) -> pd.DataFrame:
-    """Standardize IMDB IDs to ensure consistent format."""
+    """Standardize IMDB IDs to ensure consistent format (in place)."""
     # Adding 'tt' prefix if missing - IMDB standard format
-    df = df.copy()
+    # Ensure string format
+    imdb_ids = df['imdb_id'].astype('string').str.strip()
     
-    def standardize_imdb(imdb_id):
-        if pd.isna(imdb_id):
-            return imdb_id
-            
-        # Ensure string format
-        imdb_id = str(imdb_id).strip()
-        
-        # Add tt prefix if missing
-        if imdb_id and not imdb_id.startswith('tt'):
-            imdb_id = 'tt' + imdb_id
-            
-        # Validate format
-        if re.match(r'^tt\d+$', imdb_id):
-            return imdb_id
-        else:
-            return None
+    # Add tt prefix if missing
+    needs_prefix = imdb_ids.notna() & ~imdb_ids.str.startswith('tt')
+    imdb_ids = imdb_ids.where(~needs_prefix, 'tt' + imdb_ids)
     
-    df['imdb_id'] = df['imdb_id'].apply(standardize_imdb)
+    # Validate format; anything else (including empty strings) becomes missing
+    df['imdb_id'] = imdb_ids.where(imdb_ids.str.match(_IMDB_RE, na=False))
     
     return df
 
 def normalize_years(df: pd.DataFrame) -> pd.DataFrame:
-    """Normalize year values to ensure they are valid."""
+    """Normalize year values to ensure they are valid (in place)."""
     # Only accept years in reasonable range (1890-present)
-    df = df.copy()
-    
-    def clean_year(year):
-        if pd.isna(year):
-            return year
-            
-        try:
-            # Convert to float first (handles strings)
-            year_float = float(year)
-            
-            # Convert to int (removes decimal part)
-            year_int = int(year_float)
-            
-            # Validate year is in reasonable range (1890-present)
-            current_year = pd.Timestamp.now().year
-            if 1890 <= year_int <= current_year:
-                return year_int
-            else:
-                return None
-        except (ValueError, TypeError):
-            return None
+    # Coerce to numeric in one pass (strings/garbage become NaN)
+    current_year = pd.Timestamp.now().year
+    years = pd.to_numeric(df['year'], errors='coerce')
     
-    df['year'] = df['year'].apply(clean_year)
+    # Drop the decimal part, then null out anything outside the valid range
+    years = np.floor(years)
+    valid = years.between(1890, current_year)
+    df['year'] = years.where(valid).astype('Int64')
     
     return df
 
 def clean_summaries(df: pd.DataFrame) -> pd.DataFrame:
-    """Clean and standardize film summaries."""
-    # Fix common issues in text summaries (whitespace, quotes, newlines)
-    df = df.copy()
-    
-    def clean_summary(summary):
-        if pd.isna(summary) or summary == "":
-            return None
-            
-        # Fix common issues in summaries
-        summary = summary.strip()
-        
-        # Fix quotation marks
-        summary = summary.replace('"', '"').replace('"', '"')
-        
-        # Fix newlines
-        summary = summary.replace('\n', ' ').replace('\r', '')
-        
-        # Fix multiple spaces
-        summary = re.sub(r'\s+', ' ', summary)
-        
-        return summary
-    
-    df['summary'] = df['summary'].apply(clean_summary)
+    """Clean and standardize film summaries (in place)."""
+    # Fix common issues in text summaries (whitespace, newlines)
+    # Cast to object first: an all-empty column read from CSV is float64
+    summaries = (
+        df['summary'].astype(object)
+        .str.strip()
+        .str.replace('\n', ' ', regex=False)   # Fix newlines
+        .str.replace('\r', '', regex=False)
+        .str.replace(_WS_RE, ' ', regex=True)  # Fix multiple spaces
+    )
+    
+    # Empty summaries are treated as missing
+    df['summary'] = summaries.mask(summaries.eq(''))
     
     return df
 
 def normalize_people(df: pd.DataFrame) -> pd.DataFrame:
-    """Normalize the people field to ensure consistent format."""
+    """Normalize the people field to ensure consistent format (in place)."""
     # Standardize semicolon-separated lists, remove duplicates
-    df = df.copy()
-    
-    def clean_people(people):
-        if pd.isna(people) or people == "":
-            return None
-            
-        # Split by semicolon
-        if isinstance(people, str):
-            people_list = [p.strip() for p in people.split(';')]
-            
-            # Remove empty entries
-            people_list = [p for p in people_list if p]
-            
-            # Remove duplicates and sort
-            people_list = sorted(list(set(people_list)))
-            
-            # Join back with semicolons
-            return '; '.join(people_list) if people_list else None
+    # Split by semicolon in one pass, then dedupe over the raw ndarray
+    # (cast to object first: an all-empty column read from CSV is float64)
+    parts = df['people'].astype(object).str.split(';').to_numpy()
+    people = np.empty(len(parts), dtype=object)
+    for i, people_list in enumerate(parts):
+        if not isinstance(people_list, list):
+            people[i] = None
+            continue
         
-        return people
+        # Remove empty entries and duplicates, then sort
+        unique = sorted({p.strip() for p in people_list if p.strip()})
+        
+        # Join back with semicolons
+        people[i] = '; '.join(unique) if unique else None
     
-    df['people'] = df['people'].apply(clean_people)
+    df['people'] = people
     
     return df
 
@@ -176,6 +132,9 @@ def enrich_dataset(df: pd.DataFrame) -> pd.DataFrame:
     """
     Add additional derived fields to the dataset.
     
+    The columns are added in place; pass a copy (e.g. the output of
+    `clean_dataset`) if the original must stay untouched.
+    
     Args:
         df: Input DataFrame with film data
         
@@ -183,23 +142,14 @@ def enrich_dataset(df: pd.DataFrame) -> pd.DataFrame:
         Enriched DataFrame with additional columns
     """
     # Add computed columns to enhance analysis capabilities
-    df = df.copy()
-    
-    # Add decade column based on year
-    def extract_decade(year):
-        if pd.isna(year):
-            return None
-        return int(year // 10 * 10)
-    
-    df['decade'] = df['year'].apply(extract_decade)
-    
-    # Count number of people associated with the film
-    def count_people(people):
-        if pd.isna(people):
-            return 0
-        return len(people.split(';'))
+    # Add decade column based on year (nullable Int64 propagates missing years)
+    # Stored as category: only a handful of distinct decades repeat across rows
+    df['decade'] = (df['year'] // 10 * 10).astype('Int64').astype('category')
     
-    df['people_count'] = df['people'].apply(count_people)
+    # Count number of people associated with the film (separators + 1, 0 if missing)
+    # (cast to object first so an all-missing float64 column still works)
+    people_count = df['people'].astype(object).str.count(';') + 1
+    df['people_count'] = people_count.fillna(0).astype('int32')
     
     # Determine if summary exists
     df['has_summary'] = ~df['summary'].isna()
@@ -210,6 +160,9 @@ def add_language_column(df: pd.DataFrame) -> pd.DataFrame:
     """
     Extract language from film summaries where possible.
     
+    The column is added in place; pass a copy if the original must stay
+    untouched.
+    
     Args:
         df: Input DataFrame with film data
         
@@ -217,30 +170,12 @@ def add_language_column(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with additional language column
     """
     # Use regex to extract language information from summaries
-    df = df.copy()
-    
-    # Common Indian languages in films
-    languages = [
-        'Hindi', 'Tamil', 'Telugu', 'Malayalam', 'Kannada', 
-        'Bengali', 'Marathi', 'Punjabi', 'Gujarati', 'Assamese',
-        'Odia', 'Bhojpuri', 'Urdu'
-    ]
-    
-    # Create a regex pattern to match these languages
-    pattern = r'(?i)(' + '|'.join(languages) + r')[\s\-]language'
+    # Missing summaries or summaries without a match give NaN
+    # (cast to object first so an all-missing float64 column still works)
+    languages = df['summary'].astype(object).str.extract(_LANG_RE, expand=False).str.title()
     
-    def extract_language(row):
-        if pd.isna(row['summary']):
-            return None
-            
-        # Try to find language in summary
-        match = re.search(pattern, row['summary'])
-        if match:
-            return match.group(1).title()
-        
-        return None
-    
-    df['language'] = df.apply(extract_language, axis=1)
+    # Only a handful of distinct languages, so store as category
+    df['language'] = languages.astype('category')
     
     return df
 
@@ -255,14 +190,23 @@ def generate_data_quality_report(df: pd.DataFrame) -> Dict[str, Any]:
         Dictionary with quality metrics
     """
     # Generate stats for data quality assessment
+    # One null mask and one min/max pass shared by all the metrics below;
+    # percentages are derived from the counts rather than a second scan
+    null_counts = df.isna().sum()
+    null_percentages = (null_counts / len(df) * 100).round(2)
+    year_min, year_max = df['year'].agg(['min', 'max'])
+    
     report = {
         'total_rows': len(df),
-        'null_counts': {col: int(df[col].isna().sum()) for col in df.columns},
-        'null_percentages': {col: round(df[col].isna().mean() * 100, 2) for col in df.columns},
+        'null_counts': {col: int(n) for col, n in null_counts.items()},
+        'null_percentages': {col: float(pct) for col, pct in null_percentages.items()},
         'duplicates': int(df.duplicated(subset=['title']).sum()),
-        'year_range': (int(df['year'].min()) if not pd.isna(df['year'].min()) else None, 
-                      int(df['year'].max()) if not pd.isna(df['year'].max()) else None),
-        'decade_distribution': df['decade'].value_counts().to_dict() if 'decade' in df.columns else {},
+        'year_range': (int(year_min) if not pd.isna(year_min) else None,
+                       int(year_max) if not pd.isna(year_max) else None),
+        'decade_distribution': (
+            {int(k): int(v) for k, v in df['decade'].value_counts().items()}
+            if 'decade' in df.columns else {}
+        ),
     }
     
-    return report 
\ No newline at end of file
+    return report
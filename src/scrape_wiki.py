@@ -8,24 +8,34 @@ Command-line entry-point that:
 
 from __future__ import annotations
 import asyncio
-import time
 import argparse
 import json
 import os
 from collections import defaultdict
 from pathlib import Path
 
+import orjson
 import pandas as pd
 from tqdm.auto import tqdm
 
+# pyarrow is optional: it enables the faster CSV reader and Parquet output
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 from src.config import TARGET_GROUPS, DATA_PROCESSED
 from src.utils import strip_cat_prefix, slugify, chunked
 from src.wikimedia_api import (
     fetch_category_members,
+    gather_category_members,
     gather_summaries,
     query_wikidata_batch,
     run_sparql,
     _safe_request,
+    set_cache_enabled,
+    clear_cache,
 )
 from src.data_cleaning import (
     clean_dataset, 
@@ -42,6 +52,17 @@ CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
 REPORTS_DIR = Path("data/reports")
 REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Shared fallback for Q-IDs without Wikidata metadata (read-only)
+_EMPTY_META: dict = {}
+
+def write_outputs(df: pd.DataFrame, out_file: Path) -> None:
+    """Write the CSV, plus a Parquet sibling when pyarrow is available."""
+    # Parquet is columnar and dictionary-encodes repeated strings, so it is
+    # much smaller and faster to load for downstream analysis
+    df.to_csv(out_file, index=False)
+    if HAS_PYARROW:
+        df.to_parquet(out_file.with_suffix(".parquet"), index=False)
+
 # ------------------------------------------------------------------
 def build_subcats() -> dict[str, list[str]]:
     """Step 1: Build subcategory maps"""
@@ -51,8 +72,8 @@ def build_subcats() -> dict[str, list[str]]:
     # Check if checkpoint exists
     if checkpoint_file.exists():
         print(f"Loading subcategories from checkpoint: {checkpoint_file}")
-        with open(checkpoint_file, 'r') as f:
-            return json.load(f)
+        with open(checkpoint_file, 'rb') as f:
+            return orjson.loads(f.read())
     
     print("Building subcategories...")
     subcats = {}
@@ -60,8 +81,8 @@ def build_subcats() -> dict[str, list[str]]:
         subcats[group] = fetch_category_members(group, cmtype="subcat")
     
     # Save checkpoint
-    with open(checkpoint_file, 'w') as f:
-        json.dump(subcats, f)
+    with open(checkpoint_file, 'wb') as f:
+        f.write(orjson.dumps(subcats))
     
     return subcats
 
@@ -73,40 +94,44 @@ def build_films(subcats_map: dict[str, list[str]]) -> dict[str, set[str]]:
     # Check if checkpoint exists
     if checkpoint_file.exists():
         print(f"Loading films from checkpoint: {checkpoint_file}")
-        with open(checkpoint_file, 'r') as f:
+        with open(checkpoint_file, 'rb') as f:
             # Convert lists back to sets
-            films_data = json.load(f)
+            films_data = orjson.loads(f.read())
             return {k: set(v) for k, v in films_data.items()}
     
     print("Building film maps...")
+    # Each group's own pages plus those of every subcategory, fetched concurrently
+    group_cats = {
+        group: [group] + [strip_cat_prefix(subcat) for subcat in subcats]
+        for group, subcats in subcats_map.items()
+    }
+    all_cats = list(dict.fromkeys(c for cats in group_cats.values() for c in cats))
+    members = asyncio.run(gather_category_members(all_cats, cmtype="page"))
+    
     films_map: dict[str, set[str]] = defaultdict(set)
-    for group, subcats in tqdm(subcats_map.items(), desc="Groups"):
-        films_map[group].update(fetch_category_members(group, cmtype="page"))
-        for subcat in tqdm(subcats, leave=False, desc=group):
-            films_map[group].update(
-                fetch_category_members(strip_cat_prefix(subcat), cmtype="page")
-            )
+    for group, cats in group_cats.items():
+        for cat in cats:
+            films_map[group].update(members[cat])
     
     # Save checkpoint (convert sets to lists for JSON serialization)
-    with open(checkpoint_file, 'w') as f:
-        json.dump({k: list(v) for k, v in films_map.items()}, f)
+    with open(checkpoint_file, 'wb') as f:
+        f.write(orjson.dumps({k: list(v) for k, v in films_map.items()}))
     
     return films_map
 
-def resolve_qids(titles, group) -> dict[str, str]:
+def resolve_qids(titles, checkpoint_file: Path) -> dict[str, str]:
     """Step 3: Resolve Wikidata Q-IDs for titles"""
     # Map Wikipedia page titles to Wikidata QIDs for later querying
-    checkpoint_file = CHECKPOINT_DIR / f"qids_{slugify(group)}.json"
-    
     # Check if checkpoint exists
     if checkpoint_file.exists():
         print(f"Loading Q-IDs from checkpoint: {checkpoint_file}")
-        with open(checkpoint_file, 'r') as f:
-            return json.load(f)
+        with open(checkpoint_file, 'rb') as f:
+            return orjson.loads(f.read())
     
     print(f"Resolving Q-IDs for {len(titles)} titles...")
     qid_map = {}
-    for batch in tqdm(list(chunked(sorted(titles), 50)), desc="Q-IDs"):
+    n_batches = -(-len(titles) // 50)
+    for batch in tqdm(chunked(sorted(titles), 50), total=n_batches, desc="Q-IDs"):
         params = {
             "action": "query", "format": "json",
             "titles": "|".join(batch), "prop": "pageprops",
@@ -117,30 +142,29 @@ def resolve_qids(titles, group) -> dict[str, str]:
             if qid: qid_map[page["title"]] = qid
     
     # Save checkpoint
-    with open(checkpoint_file, 'w') as f:
-        json.dump(qid_map, f)
+    with open(checkpoint_file, 'wb') as f:
+        f.write(orjson.dumps(qid_map))
     
     return qid_map
 
-def fetch_metadata(qid_map, group) -> dict[str, dict]:
+def fetch_metadata(qid_map, checkpoint_file: Path) -> dict[str, dict]:
     """Step 4: Fetch Wikidata metadata for Q-IDs"""
     # Get film metadata like year, IMDB ID, people from Wikidata SPARQL
-    checkpoint_file = CHECKPOINT_DIR / f"metadata_{slugify(group)}.json"
-    
     # Check if checkpoint exists
     if checkpoint_file.exists():
         print(f"Loading metadata from checkpoint: {checkpoint_file}")
-        with open(checkpoint_file, 'r') as f:
-            return json.load(f)
+        with open(checkpoint_file, 'rb') as f:
+            return orjson.loads(f.read())
     
     print(f"Fetching metadata for {len(qid_map)} Q-IDs...")
     meta_map = {}
-    batches = list(chunked(list(qid_map.values()), 200))
-    for i, q_batch in enumerate(tqdm(batches, desc="SPARQL")):
+    # Several titles can resolve to the same Q-ID; query each one only once
+    unique_qids = list(dict.fromkeys(q for q in qid_map.values() if q))
+    n_batches = -(-len(unique_qids) // 200)
+    batches = chunked(unique_qids, 200)
+    # Rate limiting between batches is handled by run_sparql (SPARQL_MIN_INTERVAL)
+    for q_batch in tqdm(batches, total=n_batches, desc="SPARQL"):
         meta_map.update(query_wikidata_batch(q_batch))
-        # Add a delay between batches to avoid rate limiting
-        if i < len(batches) - 1:
-            time.sleep(2)  # 2 second delay between batches
     
     # Save checkpoint (convert any non-serializable types)
     serializable_meta = {}
@@ -150,51 +174,53 @@ def fetch_metadata(qid_map, group) -> dict[str, dict]:
             for k, v in data.items()
         }
     
-    with open(checkpoint_file, 'w') as f:
-        json.dump(serializable_meta, f)
+    with open(checkpoint_file, 'wb') as f:
+        f.write(orjson.dumps(serializable_meta))
     
     return meta_map
 
-def fetch_summaries(qid_map, group):
+def fetch_summaries(qid_map, checkpoint_file: Path):
     """Step 5: Fetch Wikipedia summaries for titles"""
     # Get plot summaries from Wikipedia REST API (async for performance)
-    checkpoint_file = CHECKPOINT_DIR / f"summaries_{slugify(group)}.json"
-    
     # Check if checkpoint exists
     if checkpoint_file.exists():
         print(f"Loading summaries from checkpoint: {checkpoint_file}")
-        with open(checkpoint_file, 'r') as f:
-            return json.load(f)
+        with open(checkpoint_file, 'rb') as f:
+            return orjson.loads(f.read())
     
     print(f"Fetching summaries for {len(qid_map)} titles...")
     summaries = asyncio.run(gather_summaries(list(qid_map.keys())))
     
     # Save checkpoint
-    with open(checkpoint_file, 'w') as f:
+    with open(checkpoint_file, 'wb') as f:
         # Handle None values for JSON
         json_safe_summaries = {k: v if v is not None else "" for k, v in summaries.items()}
-        json.dump(json_safe_summaries, f)
+        f.write(orjson.dumps(json_safe_summaries))
     
     return summaries
 
-def assemble_csv(qid_map, meta_map, summaries, group):
+def assemble_csv(qid_map, meta_map, summaries, group, slug):
     """Step 6: Assemble and write CSV file"""
     # Final step: build dataframe and apply cleaning and enrichment 
     # Create output directory if it doesn't exist
     DATA_PROCESSED.mkdir(parents=True, exist_ok=True)
     
     print(f"Assembling CSV for {group}...")
-    rows = []
+    # Collect one list per column rather than one dict per row
+    titles, imdb_ids, years, people = [], [], [], []
     for title, qid in qid_map.items():
-        m = meta_map.get(qid, {})
-        rows.append({
-            "title"  : title,
-            "imdb_id": m.get("imdb_id"),
-            "year"   : m.get("year"),
-            "summary": summaries.get(title),
-            "people" : m.get("people"),
-        })
-    df = pd.DataFrame(rows)
+        m = meta_map.get(qid, _EMPTY_META)
+        titles.append(title)
+        imdb_ids.append(m.get("imdb_id"))
+        years.append(m.get("year"))
+        people.append(m.get("people"))
+    df = pd.DataFrame({
+        "title"  : titles,
+        "imdb_id": imdb_ids,
+        "year"   : years,
+        "summary": [summaries.get(t) for t in titles],
+        "people" : people,
+    })
     
     # Apply data cleaning and enrichment
     print(f"Cleaning and enriching data for {group}...")
@@ -204,14 +230,14 @@ def assemble_csv(qid_map, meta_map, summaries, group):
     
     # Generate and save data quality report
     report = generate_data_quality_report(df)
-    report_file = REPORTS_DIR / f"quality_report_{slugify(group)}.json"
+    report_file = REPORTS_DIR / f"quality_report_{slug}.json"
     with open(report_file, 'w') as f:
         json.dump(report, f, indent=2)
     print(f"Data quality report saved to {report_file}")
     
     # Save the CSV
-    out_file = DATA_PROCESSED / f"indian_films_{slugify(group)}.csv"
-    df.to_csv(out_file, index=False)
+    out_file = DATA_PROCESSED / f"indian_films_{slug}.csv"
+    write_outputs(df, out_file)
     print(f"✅  Saved {len(df):5} rows → {out_file}")
     
     return df
@@ -233,8 +259,8 @@ def main(steps=None, specific_group=None):
         # Load from checkpoint if available
         checkpoint_file = CHECKPOINT_DIR / "subcats.json"
         if checkpoint_file.exists():
-            with open(checkpoint_file, 'r') as f:
-                subcats_map = json.load(f)
+            with open(checkpoint_file, 'rb') as f:
+                subcats_map = orjson.loads(f.read())
         else:
             print("Subcategories checkpoint not found. Run with --steps subcats first.")
             return
@@ -245,8 +271,8 @@ def main(steps=None, specific_group=None):
         # Load from checkpoint if available
         checkpoint_file = CHECKPOINT_DIR / "films.json"
         if checkpoint_file.exists():
-            with open(checkpoint_file, 'r') as f:
-                films_data = json.load(f)
+            with open(checkpoint_file, 'rb') as f:
+                films_data = orjson.loads(f.read())
                 films_map = {k: set(v) for k, v in films_data.items()}
         else:
             print("Films checkpoint not found. Run with --steps films first.")
@@ -264,45 +290,48 @@ def main(steps=None, specific_group=None):
     for group, titles in films_map.items():
         print(f"\n🚀  Processing {group} ({len(titles)} films)")
         
+        # Per-group checkpoint paths, derived once from the group slug
+        slug = slugify(group)
+        qids_ckpt      = CHECKPOINT_DIR / f"qids_{slug}.json"
+        meta_ckpt      = CHECKPOINT_DIR / f"metadata_{slug}.json"
+        summaries_ckpt = CHECKPOINT_DIR / f"summaries_{slug}.json"
+        
         # Step 3: Resolve Q-IDs
         if run_all or "qids" in steps:
-            qid_map = resolve_qids(titles, group)
+            qid_map = resolve_qids(titles, qids_ckpt)
         else:
-            checkpoint_file = CHECKPOINT_DIR / f"qids_{slugify(group)}.json"
-            if checkpoint_file.exists():
-                with open(checkpoint_file, 'r') as f:
-                    qid_map = json.load(f)
+            if qids_ckpt.exists():
+                with open(qids_ckpt, 'rb') as f:
+                    qid_map = orjson.loads(f.read())
             else:
                 print(f"Q-IDs checkpoint for {group} not found. Run with --steps qids first.")
                 continue
         
         # Step 4: Fetch metadata
         if run_all or "metadata" in steps:
-            meta_map = fetch_metadata(qid_map, group)
+            meta_map = fetch_metadata(qid_map, meta_ckpt)
         else:
-            checkpoint_file = CHECKPOINT_DIR / f"metadata_{slugify(group)}.json"
-            if checkpoint_file.exists():
-                with open(checkpoint_file, 'r') as f:
-                    meta_map = json.load(f)
+            if meta_ckpt.exists():
+                with open(meta_ckpt, 'rb') as f:
+                    meta_map = orjson.loads(f.read())
             else:
                 print(f"Metadata checkpoint for {group} not found. Run with --steps metadata first.")
                 continue
         
         # Step 5: Fetch summaries
         if run_all or "summaries" in steps:
-            summaries = fetch_summaries(qid_map, group)
+            summaries = fetch_summaries(qid_map, summaries_ckpt)
         else:
-            checkpoint_file = CHECKPOINT_DIR / f"summaries_{slugify(group)}.json"
-            if checkpoint_file.exists():
-                with open(checkpoint_file, 'r') as f:
-                    summaries = json.load(f)
+            if summaries_ckpt.exists():
+                with open(summaries_ckpt, 'rb') as f:
+                    summaries = orjson.loads(f.read())
             else:
                 print(f"Summaries checkpoint for {group} not found. Run with --steps summaries first.")
                 continue
         
         # Step 6: Assemble CSV
         if run_all or "csv" in steps:
-            assemble_csv(qid_map, meta_map, summaries, group)
+            assemble_csv(qid_map, meta_map, summaries, group, slug)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Scrape Wikipedia/Wikidata for film information")
@@ -323,14 +352,29 @@ if __name__ == "__main__":
         action="store_true",
         help="Only clean existing CSV files without scraping new data"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk HTTP response cache for this run"
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Delete all cached HTTP responses before running"
+    )
     args = parser.parse_args()
     
+    if args.clear_cache:
+        clear_cache()
+    if args.no_cache:
+        set_cache_enabled(False)
+    
     if args.clean_only:
         # Only clean existing files
         for csv_file in DATA_PROCESSED.glob("*.csv"):
             group_name = csv_file.stem.replace("indian_films_", "")
             print(f"Cleaning existing file: {csv_file}")
-            df = pd.read_csv(csv_file)
+            df = pd.read_csv(csv_file, engine="pyarrow" if HAS_PYARROW else "c")
             df = clean_dataset(df)
             df = enrich_dataset(df)
             df = add_language_column(df)
@@ -343,7 +387,7 @@ if __name__ == "__main__":
             print(f"Data quality report saved to {report_file}")
             
             # Save the cleaned CSV
-            df.to_csv(csv_file, index=False)
+            write_outputs(df, csv_file)
             print(f"✅  Saved {len(df):5} cleaned rows → {csv_file}")
     else:
         main(args.steps, args.group)
@@ -1,21 +1,25 @@
 # src/utils.py
 import re
+from itertools import islice
 from collections.abc import Iterable
 from typing import Iterator, TypeVar
 
 T = TypeVar("T")
 
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+
 def slugify(text: str) -> str:
     """`My Cool Name` → `my_cool_name`."""
     # Converts a title to a URL/filename friendly format
-    return re.sub(r"[^A-Za-z0-9]+", "_", text).strip("_").lower()
+    return _SLUG_RE.sub("_", text).strip("_").lower()
 
 def chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
     """Yield `size`-length chunks from any iterable."""
     # Helper to split large lists into chunks - used for batched API calls
-    it = list(iterable)
-    for i in range(0, len(it), size):
-        yield it[i : i + size]
+    # Streams from the iterator so the input is never copied as a whole
+    it = iter(iterable)
+    while batch := list(islice(it, size)):
+        yield batch
 
 def strip_cat_prefix(title: str) -> str:
     """Remove the leading 'Category:' if present."""
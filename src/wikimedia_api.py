@@ -5,13 +5,11 @@ Doing all network I/O here keeps the scraper logic in `scrape_wiki.py`
 easy to read and test.
 """
 from __future__ import annotations
-import time, requests, asyncio, aiohttp, urllib.parse
-from datetime import datetime
+import sys, time, json, sqlite3, requests, asyncio, aiohttp, urllib.parse
 from collections import defaultdict
 from typing import Any
 
 import pandas as pd
-from SPARQLWrapper import SPARQLWrapper, JSON
 from tqdm.auto import tqdm
 
 from src.config import (
@@ -19,70 +17,221 @@ from src.config import (
     WIKIDATA_ENDPOINT,
     HEADERS,
     MAX_CONCURRENCY,
+    HTTP_CACHE,
+    SPARQL_MIN_INTERVAL,
 )
 
+# ---------- HTTP session ----------
+# One shared session so repeated calls reuse the same TCP/TLS connection
+_session = requests.Session()
+_session.headers.update(HEADERS)
+
+# ---------- On-disk response cache ----------
+# Memoizes API responses across runs so a resumed pipeline skips calls it already made
+_cache_conn: sqlite3.Connection | None = None
+_cache_enabled = True
+
+def set_cache_enabled(enabled: bool) -> None:
+    """Turn the on-disk response cache on or off (off = always hit the network)."""
+    global _cache_enabled
+    _cache_enabled = enabled
+
+def clear_cache() -> None:
+    """Delete every cached response so the next run fetches everything fresh."""
+    with _cache() as conn:
+        conn.execute("DELETE FROM responses")
+
+def _cache() -> sqlite3.Connection:
+    # Open (and create) the cache database lazily on first use
+    global _cache_conn
+    if _cache_conn is None:
+        HTTP_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _cache_conn = sqlite3.connect(HTTP_CACHE)
+        _cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, json TEXT)"
+        )
+    return _cache_conn
+
+def _cache_get(key: str) -> Any | None:
+    if not _cache_enabled:
+        return None
+    row = _cache().execute("SELECT json FROM responses WHERE key = ?", (key,)).fetchone()
+    return json.loads(row[0]) if row else None
+
+def _cache_put(key: str, value: Any) -> None:
+    if not _cache_enabled:
+        return
+    with _cache() as conn:
+        conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?)",
+                     (key, json.dumps(value)))
+
 # ---------- SPARQL ----------
-# Initialize SPARQL wrapper for Wikidata queries
-sparql = SPARQLWrapper(WIKIDATA_ENDPOINT)
-sparql.setReturnFormat(JSON)
+# Start time of the last request actually sent to the SPARQL endpoint
+_last_sparql_call = 0.0
+
+def _post_sparql(query: str) -> dict[str, Any]:
+    # Pace requests so consecutive queries start at least SPARQL_MIN_INTERVAL apart;
+    # a query that already took that long goes straight through
+    global _last_sparql_call
+    wait = SPARQL_MIN_INTERVAL - (time.monotonic() - _last_sparql_call)
+    if wait > 0:
+        time.sleep(wait)
+    _last_sparql_call = time.monotonic()
+    resp = _session.post(WIKIDATA_ENDPOINT,
+                         data={"query": query},
+                         headers={"Accept": "application/sparql-results+json"},
+                         timeout=60)
+    resp.raise_for_status()
+    return resp.json()
+
+def _retry_after(exc: Exception) -> float | None:
+    # Seconds requested by the server's Retry-After header (e.g. on HTTP 429), if any
+    resp = getattr(exc, "response", None)
+    value = resp.headers.get("Retry-After") if resp is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
 
 def run_sparql(query: str, retries: int = 3, backoff: float = 2.0) -> list[dict[str, str]]:
-    """Run a SPARQL query and return bindings as dicts."""
+    """Run a SPARQL query and return bindings as dicts (cached on disk by query text)."""
+    key = f"sparql:{query}"
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    
     for attempt in range(1, retries + 1):
         try:
-            sparql.setQuery(query)
-            results = sparql.query().convert()
-            return [
+            results = _post_sparql(query)
+            rows = [
                 {k: v.get("value") for k, v in row.items()}
                 for row in results["results"]["bindings"]
             ]
+            _cache_put(key, rows)
+            return rows
         except Exception as e:
             if attempt == retries:
                 raise
-            sleep_time = backoff * attempt
+            sleep_time = _retry_after(e) or backoff * attempt
             print(f"SPARQL query failed, retrying in {sleep_time}s... (Attempt {attempt}/{retries})")
             time.sleep(sleep_time)
 
 # ---------- MediaWiki helpers ----------
+def _mediawiki_key(params: dict[str, Any]) -> str:
+    # Cache key shared by the sync and async MediaWiki paths
+    return "mediawiki:" + json.dumps(params, sort_keys=True)
+
+def _is_cacheable(data: dict[str, Any]) -> bool:
+    # MediaWiki reports errors like maxlag/ratelimited as HTTP 200 with an
+    # "error" body; only real query results may be cached, or a temporary
+    # failure would be replayed forever
+    return "error" not in data and "query" in data
+
 def _safe_request(params: dict[str, Any],
                   retries: int = 3,
                   backoff: float = 1.5) -> dict[str, Any]:
     # Helper function to make API requests with retry logic
+    # Responses are cached on disk, keyed by the canonicalized params
+    key = _mediawiki_key(params)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    
     for attempt in range(1, retries + 1):
         try:
-            resp = requests.get(MEDIAWIKI_API,
+            resp = _session.get(MEDIAWIKI_API,
                                 params=params,
-                                headers=HEADERS,
                                 timeout=30)
             resp.raise_for_status()
-            return resp.json()
+            data = resp.json()
+            if _is_cacheable(data):
+                _cache_put(key, data)
+            return data
         except (requests.exceptions.RequestException, ValueError):
             if attempt == retries:
                 raise
             time.sleep(backoff * attempt)
 
+def _category_params(cat_title: str,
+                     cmtype: str,
+                     limit: int | str,
+                     cont_token: str) -> dict[str, Any]:
+    # Query parameters for one page of a categorymembers listing
+    return {
+        "action"  : "query",
+        "format"  : "json",
+        "list"    : "categorymembers",
+        "cmtitle" : f"Category:{cat_title}",
+        "cmtype"  : cmtype,
+        "cmlimit" : limit,
+        "cmcontinue": cont_token,
+    }
+
 def fetch_category_members(cat_title: str,
                            cmtype: str = "subcat",
                            limit: int | str = "max") -> list[str]:
     """List pages (or sub-cats) inside a category title (without 'Category:' prefix)."""
     members, cont_token = [], ""
     while True:
-        params = {
-            "action"  : "query",
-            "format"  : "json",
-            "list"    : "categorymembers",
-            "cmtitle" : f"Category:{cat_title}",
-            "cmtype"  : cmtype,
-            "cmlimit" : limit,
-            "cmcontinue": cont_token,
-        }
-        data = _safe_request(params)
+        data = _safe_request(_category_params(cat_title, cmtype, limit, cont_token))
+        members.extend(m["title"] for m in data["query"]["categorymembers"])
+        cont_token = data.get("continue", {}).get("cmcontinue", "")
+        if not cont_token:
+            break
+    return members
+
+# ---------- Async category members ----------
+# Pagination within a category is serial, but categories can be walked concurrently
+async def _fetch_category_members(session: aiohttp.ClientSession,
+                                  sem: asyncio.Semaphore,
+                                  cat_title: str,
+                                  cmtype: str = "page",
+                                  limit: int | str = "max",
+                                  retries: int = 3,
+                                  backoff: float = 1.5) -> list[str]:
+    members, cont_token = [], ""
+    while True:
+        params = _category_params(cat_title, cmtype, limit, cont_token)
+        # Same on-disk cache as _safe_request, so a resumed run skips fetched pages
+        key = _mediawiki_key(params)
+        data = _cache_get(key)
+        for attempt in range(1, retries + 1):
+            if data is not None:
+                break
+            try:
+                async with sem, session.get(MEDIAWIKI_API, params=params,
+                                            headers=HEADERS) as resp:
+                    resp.raise_for_status()
+                    data = await resp.json()
+                if _is_cacheable(data):
+                    _cache_put(key, data)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                if attempt == retries:
+                    raise
+                await asyncio.sleep(backoff * attempt)
         members.extend(m["title"] for m in data["query"]["categorymembers"])
         cont_token = data.get("continue", {}).get("cmcontinue", "")
         if not cont_token:
             break
     return members
 
+async def gather_category_members(titles: list[str],
+                                  cmtype: str = "page") -> dict[str, list[str]]:
+    """Fetch members of many categories at once; maps each title to its members."""
+    # Same MAX_CONCURRENCY semaphore pattern as gather_summaries
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        async def worker(t):
+            return t, await _fetch_category_members(session, sem, t, cmtype)
+
+        tasks = [asyncio.create_task(worker(t)) for t in titles]
+        out   = {}
+        for fut in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Categories"):
+            title, members = await fut
+            out[title] = members
+    return out
+
 # ---------- Async summaries ----------
 # Utilizing async to speed up summary fetching (major performance bottleneck otherwise)
 async def _fetch_summary(session: aiohttp.ClientSession, title: str) -> str | None:
@@ -129,13 +278,16 @@ def query_wikidata_batch(qids: list[str]) -> dict[str, dict[str, str | int | Non
         qid = row["film"].split("/")[-1]
         e   = out.setdefault(qid, {"imdb_id": None, "year": None, "people": set()})
         e["imdb_id"] = e["imdb_id"] or row.get("imdb")
-        if "date" in row and e["year"] is None:
+        # Wikidata dates look like "1999-05-20T00:00:00Z"; the year is the first 4 chars
+        date = row.get("date")
+        if date and e["year"] is None:
             try:
-                e["year"] = datetime.fromisoformat(row["date"].split("T")[0]).year
-            except Exception:
+                e["year"] = int(date[:4])
+            except ValueError:
                 pass
         if "personLabel" in row:
-            e["people"].add(row["personLabel"])
+            # The same person labels recur across Q-IDs; intern to share one copy
+            e["people"].add(sys.intern(row["personLabel"]))
     for e in out.values():
         e["people"] = "; ".join(sorted(e["people"])) if e["people"] else None
     return out